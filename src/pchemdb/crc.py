@@ -11,13 +11,16 @@ Example: Parse CRC CSV into data structure
 ...         data.extend(parse_crc)
 """
 
+import functools
 from importlib.resources import files
 import json
 import logging
+import math
 import re
 from typing import Any
 from typing import NamedTuple
 
+import numpy as np
 from pint import Quantity
 from pyEQL import ureg
 
@@ -44,12 +47,55 @@ molar_cond_conc_re2 = re.compile(
 cond_conc_re = re.compile("<i>\u03ba</i>" r"\((?P<conc>\d+(\.\d+)?)%\)")
 activity_conc_re = re.compile("<i>\u03b3</i>" r"\((?P<conc>\d+\.\d+) m\)")
 xml_tags_re = re.compile(r"<(/)?[^>]+>")
+ion_charge_re = re.compile(r"\[(?P<charge>[+-]\d+)\]$")
 DEFAULT_TEMPERATURE = "298.15 K"
 _CONDUCTIVITY_CONC_KEY = "<i>c</i>/M"
 _CONDUCTIVITY_UNITS = "S/m"
 _CONCENTRATION_UNITS = "mol/L"
 _TEMPERATURE_UNITS = "K"
 DB_FILE = "crc.json"
+_CATEGORICAL_COLUMNS = (
+    "cation",
+    "anion",
+    "stoichiometry",
+    "property",
+    "concentration_unit",
+    "unit",
+)
+_NUMERIC_COLUMNS = ("concentration", "temperature", "value")
+_TABLE_COLUMNS = (
+    "cation",
+    "anion",
+    "stoichiometry",
+    "property",
+    "concentration",
+    "concentration_unit",
+    "temperature",
+    "value",
+    "unit",
+)
+
+
+class CRCTable(NamedTuple):
+    """A long-format, column-oriented export of the CRC database.
+
+    Each row corresponds to a single property value. The columns are
+    ``cation``, ``anion``, ``stoichiometry``, ``property``,
+    ``concentration``, ``concentration_unit``, ``temperature`` (in K),
+    ``value``, and ``unit``.
+
+    Attributes:
+        columns: A dictionary mapping column names to read-only, contiguous
+            1-D arrays. Numeric columns (``concentration``, ``temperature``,
+            and ``value``) are ``float64`` arrays. Categorical columns are
+            ``int32`` arrays of codes into the corresponding entry of
+            ``categories``.
+        categories: A dictionary mapping the name of each categorical column
+            to an array of its labels.
+    """
+
+    columns: dict[str, np.ndarray]
+    categories: dict[str, np.ndarray]
 
 
 class _ParseResult(NamedTuple):
@@ -239,3 +285,131 @@ def load_crc_database() -> list[
 
     with json_db_file.open(mode="r", encoding="utf-8") as file:
         return json.load(file)
+
+
+def _ion_charge(ion: str) -> int:
+    match = ion_charge_re.search(ion)
+
+    if match is None:
+        msg = f"Unable to determine charge of ion: {ion}"
+        raise ValueError(msg)
+
+    return int(match.group("charge"))
+
+
+@functools.cache
+def _build_crc_table() -> CRCTable:
+    database = load_crc_database()
+    size = sum(len(solution_data) for _, _, solution_data in database)
+    # Each row of these C-contiguous blocks is a contiguous column
+    numeric = np.empty((len(_NUMERIC_COLUMNS), size), dtype=np.float64)
+    codes = np.empty((len(_CATEGORICAL_COLUMNS), size), dtype=np.int32)
+    lookups: list[dict[str, int]] = [{} for _ in _CATEGORICAL_COLUMNS]
+    row = 0
+
+    for solution, _, solution_data in database:
+        ions = {
+            _ion_charge(ion): (ion, c)
+            for ion, c in solution["solutes"].items()
+        }
+        z_cation = max(ions)
+        z_anion = min(ions)
+        cation, cation_conc = ions[z_cation]
+        anion, _ = ions[z_anion]
+        divisor = math.gcd(z_cation, z_anion)
+        nu_cation = -z_anion // divisor
+        nu_anion = z_cation // divisor
+        conc_mag, _, conc_units = cation_conc.partition(" ")
+        temp_mag, _, _ = solution["temperature"].partition(" ")
+
+        for prop, value in solution_data:
+            value_mag, _, value_units = value.partition(" ")
+            labels = (
+                cation,
+                anion,
+                f"{nu_cation}:{nu_anion}",
+                prop,
+                conc_units,
+                value_units or "dimensionless",
+            )
+            for i, label in enumerate(labels):
+                codes[i, row] = lookups[i].setdefault(label, len(lookups[i]))
+
+            numeric[0, row] = float(conc_mag) / nu_cation
+            numeric[1, row] = float(temp_mag)
+            numeric[2, row] = float(value_mag)
+            row += 1
+
+    numeric.flags.writeable = False
+    codes.flags.writeable = False
+    arrays = dict(zip(_NUMERIC_COLUMNS, numeric, strict=True))
+    arrays.update(zip(_CATEGORICAL_COLUMNS, codes, strict=True))
+    categories = {}
+
+    for name, lookup in zip(_CATEGORICAL_COLUMNS, lookups, strict=True):
+        labels = np.array(list(lookup), dtype=np.str_)
+        labels.flags.writeable = False
+        categories[name] = labels
+
+    return CRCTable(
+        columns={name: arrays[name] for name in _TABLE_COLUMNS},
+        categories=categories,
+    )
+
+
+def to_numpy() -> CRCTable:
+    """Export the CRC database as a long-format table of NumPy arrays.
+
+    The table is built once and cached. Subsequent calls return read-only
+    views of the cached arrays.
+
+    Returns:
+        A :class:`CRCTable`. The concentration is that of the salt (i.e., the
+        cation concentration divided by its stoichiometric coefficient) and
+        ``stoichiometry`` is labelled ``"{nu_cation}:{nu_anion}"``.
+    """
+    table = _build_crc_table()
+    return CRCTable(
+        columns={k: v.view() for k, v in table.columns.items()},
+        categories={k: v.view() for k, v in table.categories.items()},
+    )
+
+
+@functools.cache
+def _build_crc_frame() -> Any:
+    try:
+        import pandas as pd  # noqa: PLC0415
+    except ImportError as err:
+        msg = (
+            "pandas is required to export the CRC database to a DataFrame. "
+            "Install it with: pip install pchemdb[pandas]"
+        )
+        raise ImportError(msg) from err
+
+    table = _build_crc_table()
+    data = {
+        name: pd.Categorical.from_codes(
+            column, categories=table.categories[name]
+        )
+        if name in table.categories
+        else column
+        for name, column in table.columns.items()
+    }
+    return pd.DataFrame(data, copy=False)
+
+
+def to_pandas() -> Any:
+    """Export the CRC database as a long-format :class:`pandas.DataFrame`.
+
+    Categorical columns are stored as :class:`pandas.Categorical`. The
+    DataFrame is built once and cached. Subsequent calls return shallow
+    copies which share the cached data.
+
+    Returns:
+        A :class:`pandas.DataFrame` with the columns described in
+        :class:`CRCTable`.
+
+    Raises:
+        ImportError: If pandas is not installed.
+    """
+    return _build_crc_frame().copy(deep=False)
@@ -0,0 +1,184 @@
+"""A registry of the databases distributed with ``pchemdb``.
+
+Databases are discovered through the manifest in ``pchemdb/_database`` and
+exposed as lazily loaded :class:`Database` handles.
+
+Example: Warm all databases concurrently
+
+>>> from pchemdb.registry import load_all
+>>> databases = load_all()
+>>> "crc" in databases
+True
+"""
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from importlib.resources import files
+import json
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+
+class Database:
+    """A lazily loaded database.
+
+    The database file is only decoded on the first call to :meth:`load`.
+    Loading is thread-safe: concurrent callers wait for a single decode.
+
+    Attributes:
+        name: The name of the database.
+        filename: The name of the database file in ``pchemdb/_database``.
+        description: A description of the database.
+    """
+
+    def __init__(
+        self, name: str, filename: str, description: str = ""
+    ) -> None:
+        """Create a handle for a database.
+
+        Args:
+            name: The name of the database.
+            filename: The name of the database file in ``pchemdb/_database``.
+            description: A description of the database. Defaults to an
+                empty string.
+        """
+        self.name = name
+        self.filename = filename
+        self.description = description
+        self._data: list[Any] | None = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Return a representation of the handle."""
+        return f"{type(self).__name__}(name={self.name!r}, filename={self.filename!r})"
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the database has been loaded."""
+        return self._data is not None
+
+    def load(self) -> list[Any]:
+        """Load the database.
+
+        Returns:
+            The decoded database. The result is cached and shared between
+            callers.
+        """
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    logger.debug("Loading database: %s", self.name)
+                    json_db_file = files("pchemdb").joinpath(
+                        "_database", self.filename
+                    )
+                    with json_db_file.open(mode="r", encoding="utf-8") as file:
+                        self._data = json.load(file)
+
+        return self._data
+
+
+@functools.cache
+def _read_manifest() -> dict[str, Database]:
+    manifest_file = files("pchemdb").joinpath("_database", MANIFEST_FILE)
+
+    with manifest_file.open(mode="r", encoding="utf-8") as file:
+        manifest: dict[str, dict[str, str]] = json.load(file)
+
+    return {
+        name: Database(
+            name=name,
+            filename=entry["file"],
+            description=entry.get("description", ""),
+        )
+        for name, entry in manifest.items()
+    }
+
+
+def list_databases() -> list[str]:
+    """List the names of the available databases."""
+    return list(_read_manifest())
+
+
+def get_database(name: str) -> Database:
+    """Retrieve the handle for a database.
+
+    Args:
+        name: The name of the database.
+
+    Returns:
+        The :class:`Database` handle. Handles are shared, so a database is
+        only decoded once per process.
+
+    Raises:
+        KeyError: If no database named ``name`` is registered.
+    """
+    registry = _read_manifest()
+
+    if name not in registry:
+        msg = (
+            f"Unknown database: {name}. Available databases: "
+            f"{', '.join(registry)}"
+        )
+        raise KeyError(msg)
+
+    return registry[name]
+
+
+def load_all(
+    names: Iterable[str] | None = None, max_workers: int | None = None
+) -> dict[str, list[Any]]:
+    """Load databases concurrently on a thread pool.
+
+    Args:
+        names: The names of the databases to load. Defaults to all
+            registered databases.
+        max_workers: The maximum number of threads to use. Defaults to one
+            thread per database.
+
+    Returns:
+        A dictionary mapping database names to the decoded databases.
+    """
+    if names is None:
+        names = list_databases()
+
+    databases = [get_database(name) for name in names]
+
+    if not databases:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or len(databases)
+    ) as executor:
+        results = executor.map(Database.load, databases)
+        return {
+            db.name: data for db, data in zip(databases, results, strict=True)
+        }
+
+
+async def aload_all(
+    names: Iterable[str] | None = None,
+) -> dict[str, list[Any]]:
+    """Load databases concurrently with :func:`asyncio.to_thread`.
+
+    Args:
+        names: The names of the databases to load. Defaults to all
+            registered databases.
+
+    Returns:
+        A dictionary mapping database names to the decoded databases.
+    """
+    if names is None:
+        names = list_databases()
+
+    databases = [get_database(name) for name in names]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(db.load) for db in databases)
+    )
+    return {db.name: data for db, data in zip(databases, results, strict=True)}
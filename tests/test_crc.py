@@ -2,10 +2,13 @@ import csv
 import json
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from pchemdb.crc import load_crc_database
 from pchemdb.crc import parse_crc
+from pchemdb.crc import to_numpy
+from pchemdb.crc import to_pandas
 
 MOLAR_CONDUCTIVITY_SOURCES = [
     "Molar Electrical Conductivity of Aqueous HBr as a Function of Temperature and Concentration.csv",
@@ -138,3 +141,60 @@ class TestLoadCRCData:
     @staticmethod
     def test_should_load_crc_data() -> None:
         assert load_crc_database()
+
+
+class TestToNumpy:
+    @staticmethod
+    def test_should_export_one_row_per_property() -> None:
+        size = sum(len(data) for _, _, data in load_crc_database())
+        table = to_numpy()
+        assert all(len(c) == size for c in table.columns.values())
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "column", ["concentration", "temperature", "value"]
+    )
+    def test_should_export_numeric_columns_as_contiguous_floats(
+        column: str,
+    ) -> None:
+        array = to_numpy().columns[column]
+        assert array.dtype == np.float64
+        assert array.flags.c_contiguous
+
+    @staticmethod
+    def test_should_return_views_of_cached_table() -> None:
+        first = to_numpy()
+        second = to_numpy()
+        for name, column in first.columns.items():
+            assert np.shares_memory(column, second.columns[name])
+            assert not column.flags.writeable
+
+    @staticmethod
+    def test_should_derive_stoichiometry_from_ion_charges() -> None:
+        table = to_numpy()
+        cation = table.categories["cation"][table.columns["cation"]]
+        anion = table.categories["anion"][table.columns["anion"]]
+        stoichiometry = table.categories["stoichiometry"][
+            table.columns["stoichiometry"]
+        ]
+        index = np.flatnonzero((cation == "Ca[+2]") & (anion == "Cl[-1]"))
+        assert index.size
+        assert set(stoichiometry[index]) == {"1:2"}
+
+
+class TestToPandas:
+    @staticmethod
+    def test_should_export_dataframe() -> None:
+        pd = pytest.importorskip("pandas")
+        frame = to_pandas()
+        assert len(frame) == len(to_numpy().columns["value"])
+        assert isinstance(frame["cation"].dtype, pd.CategoricalDtype)
+        assert frame["value"].dtype == np.float64
+
+    @staticmethod
+    def test_should_share_memory_with_numpy_export() -> None:
+        pytest.importorskip("pandas")
+        frame = to_pandas()
+        assert np.shares_memory(
+            frame["value"].to_numpy(), to_numpy().columns["value"]
+        )
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from pchemdb.crc import load_crc_database
+from pchemdb.registry import Database
+from pchemdb.registry import aload_all
+from pchemdb.registry import get_database
+from pchemdb.registry import list_databases
+from pchemdb.registry import load_all
+
+
+class TestRegistry:
+    @staticmethod
+    def test_should_register_crc_database() -> None:
+        assert "crc" in list_databases()
+
+    @staticmethod
+    def test_should_share_handles() -> None:
+        assert get_database("crc") is get_database("crc")
+
+    @staticmethod
+    def test_should_raise_key_error_for_unknown_database() -> None:
+        with pytest.raises(KeyError, match="Unknown database"):
+            get_database("not-a-database")
+
+
+class TestDatabase:
+    @staticmethod
+    def test_should_load_lazily() -> None:
+        database = Database(name="crc", filename="crc.json")
+        assert not database.loaded
+        assert database.load() == load_crc_database()
+        assert database.loaded
+
+    @staticmethod
+    def test_should_cache_loaded_data() -> None:
+        database = Database(name="crc", filename="crc.json")
+        assert database.load() is database.load()
+
+
+class TestLoadAll:
+    @staticmethod
+    def test_should_load_all_databases() -> None:
+        databases = load_all()
+        assert set(databases) == set(list_databases())
+        assert all(databases.values())
+
+    @staticmethod
+    def test_should_load_selected_databases() -> None:
+        assert list(load_all(["crc"], max_workers=1)) == ["crc"]
+
+    @staticmethod
+    def test_should_load_nothing_if_no_names() -> None:
+        assert load_all([]) == {}
+
+    @staticmethod
+    def test_should_load_all_databases_asynchronously() -> None:
+        databases = asyncio.run(aload_all())
+        assert databases == load_all()